@@ -6,39 +6,108 @@ This script extracts full content from X.com articles and saves them as markdown
 It uses browser automation to handle dynamic content loading.
 
 Usage:
-    python x_to_markdown.py <x.com_url>
+    python x_to_markdown.py [-o output_dir] [options] <x.com_url> [<x.com_url> ...]
     
 Example:
     python x_to_markdown.py https://x.com/bozhou_ai/status/2011738838767423983
+
+Run with --help for all options.
 """
 
+import io
 import sys
+import html
+import argparse
 import re
-import json
+import math
+import time
+import atexit
+import asyncio
+import unicodedata
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _loads = json.loads
+
+
+USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
+)
+SYNDICATION_URL = 'https://cdn.syndication.twimg.com/tweet-result'
+SYNDICATION_CLIENT_OPTIONS = {'http2': True, 'headers': {'User-Agent': USER_AGENT}, 'timeout': 10.0}
+ALLOWED_HOSTS = {'x.com', 'www.x.com', 'mobile.x.com', 'twitter.com', 'www.twitter.com', 'mobile.twitter.com'}
+BROWSER_ARGS = ['--disable-dev-shm-usage', '--no-sandbox']
+# Chromium profile kept between runs so the HTTP disk cache survives
+PROFILE_DIR = Path.home() / '.cache' / 'xpost2md-chromium'
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1280, 'height': 720},
+    'user_agent': USER_AGENT,
+    # Service workers would serve X's bundles around page.route() and the disk cache
+    'service_workers': 'block'
+}
+# Extracted content cached per status ID so repeat runs skip the network
+CACHE_DIR = Path.home() / '.cache' / 'xpost2md'
+CACHE_TTL = 24 * 60 * 60
+# Number of pages loaded concurrently in batch mode
+BATCH_JOBS = 4
+# Requests the markdown output does not need (image URLs stay in the DOM and
+# the extractor sizes media from the URL, not the decoded image)
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+BLOCKED_URL_PARTS = ('google-analytics', 'doubleclick', 'branch.io')
+# Present once the tweet or article body has rendered
+CONTENT_SELECTOR = '[data-testid="tweetText"], [data-testid="article-body"]'
+MAX_SCROLLS = 8
+# One rendered tweet in a thread/timeline
+CELL_SELECTOR = '[data-testid="cellInnerDiv"]'
+
+_RE_NON_ALNUM = re.compile(r'[^A-Za-z0-9]+')
+_RE_STATUS = re.compile(r'/status/(\d+)')
+_RE_TOKEN_STRIP = re.compile(r'(0+|\.)')
+_STAT_LABELS = {
+    'reply': 'Replies',
+    'retweet': 'Retweets',
+    'like': 'Likes',
+    'bookmark': 'Bookmarks',
+    'view': 'Views'
+}
+
+
+class _CombiningMarks(dict):
+    """str.translate table that deletes combining marks, filled lazily per code point."""
+
+    def __missing__(self, codepoint):
+        value = None if unicodedata.combining(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING = _CombiningMarks()
 
 
 def sanitize_filename(title: str) -> str:
     """Convert title to a safe filename (English only, short, no spaces)."""
     if not title:
         return ''
-    normalized = title
-    try:
-        normalized = normalized.encode('utf-8', 'ignore').decode('utf-8')
-    except Exception:
-        pass
     # Normalize accents
-    try:
-        import unicodedata
-        normalized = unicodedata.normalize('NFKD', normalized)
-        normalized = ''.join(ch for ch in normalized if not unicodedata.combining(ch))
-    except Exception:
-        pass
-    # Keep only ASCII letters/digits
-    safe_title = re.sub(r'[^A-Za-z0-9]+', '_', normalized)
-    safe_title = re.sub(r'_+', '_', safe_title)
+    normalized = unicodedata.normalize('NFKD', title).translate(_STRIP_COMBINING)
+    # Keep only ASCII letters/digits (runs collapse to one underscore)
+    safe_title = _RE_NON_ALNUM.sub('_', normalized)
     safe_title = safe_title.strip('_').lower()
     return safe_title[:60]
 
@@ -50,7 +119,7 @@ def build_filename(data: dict, url: str) -> str:
     handle = (data.get('handle', '') or '').lstrip('@').strip()
     handle_slug = sanitize_filename(handle)
 
-    match = re.search(r'/status/(\d+)', url)
+    match = _RE_STATUS.search(url)
     status_id = match.group(1) if match else ''
 
     if not slug or len(slug) < 3:
@@ -65,280 +134,674 @@ def build_filename(data: dict, url: str) -> str:
     return slug
 
 
-def extract_x_content(url: str, headless: bool = True) -> dict:
+def _to_base36(value: float) -> str:
+    """Format a positive float the way JavaScript's Number.toString(36) does."""
+    chars = '0123456789abcdefghijklmnopqrstuvwxyz'
+    whole = int(value)
+    fraction = value - whole
+    # Emit fraction digits until they stop being significant (mirrors V8)
+    delta = max(0.5 * math.ulp(value), math.ulp(0.0))
+    digits = []
+    if fraction >= delta:
+        while True:
+            fraction *= 36
+            delta *= 36
+            digit = int(fraction)
+            digits.append(digit)
+            fraction -= digit
+            if (fraction > 0.5 or (fraction == 0.5 and digit & 1)) and fraction + delta > 1:
+                # Round up, carrying into the integer part if needed
+                while digits and digits[-1] == 35:
+                    digits.pop()
+                if digits:
+                    digits[-1] += 1
+                else:
+                    whole += 1
+                break
+            if fraction < delta:
+                break
+
+    integer_part = ''
+    while True:
+        whole, rem = divmod(whole, 36)
+        integer_part = chars[rem] + integer_part
+        if not whole:
+            break
+    if not digits:
+        return integer_part
+    return integer_part + '.' + ''.join(chars[d] for d in digits)
+
+
+def _syndication_token(status_id: str) -> str:
+    """Token expected by the syndication endpoint (same formula as the embed widget)."""
+    value = _to_base36(int(status_id) / 1e15 * math.pi)
+    return _RE_TOKEN_STRIP.sub('', value)
+
+
+def _fetch_syndication(status_id: str) -> dict:
+    """
+    Fetch a tweet from X's public syndication endpoint without a browser.
+
+    Args:
+        status_id: Numeric tweet ID
+
+    Returns:
+        Dictionary in the same shape as extract_x_content (markdown body
+        included), or None when the payload does not carry the full text
+        (X articles, long-form notes, tombstones) and the browser path is
+        needed.
+    """
+    import httpx
+
+    with httpx.Client(**SYNDICATION_CLIENT_OPTIONS) as client:
+        response = client.get(SYNDICATION_URL, params=_syndication_params(status_id))
+        response.raise_for_status()
+        return _parse_syndication(response.json())
+
+
+async def _fetch_syndication_async(status_id: str, client) -> dict:
+    """Async variant of _fetch_syndication using a shared httpx.AsyncClient."""
+    response = await client.get(SYNDICATION_URL, params=_syndication_params(status_id))
+    response.raise_for_status()
+    return _parse_syndication(response.json())
+
+
+def _syndication_params(status_id: str) -> dict:
+    return {'id': status_id, 'lang': 'en', 'token': _syndication_token(status_id)}
+
+
+def _parse_syndication(tweet: dict) -> dict:
+    """Map a syndication tweet payload onto the extract_x_content dict shape."""
+    # Articles and long notes only expose a preview here
+    if tweet.get('article') or tweet.get('note_tweet'):
+        return None
+
+    # Text arrives HTML-escaped; display_text_range indexes the unescaped text
+    text = html.unescape(tweet.get('text') or '')
+    text_range = tweet.get('display_text_range')
+    if text_range and len(text_range) == 2:
+        text = text[text_range[0]:text_range[1]]
+    # Show the real links instead of t.co short URLs, as the page does
+    for link in (tweet.get('entities') or {}).get('urls') or []:
+        short_url = link.get('url')
+        full_url = link.get('expanded_url') or link.get('display_url')
+        if short_url and full_url:
+            text = text.replace(short_url, full_url)
+    text = text.strip()
+    if not text:
+        return None
+
+    user = tweet.get('user') or {}
+    result = {
+        'title': text.split('\n')[0][:100],
+        'author': user.get('name', ''),
+        'handle': f"@{user['screen_name']}" if user.get('screen_name') else '',
+        'timestamp': tweet.get('created_at', ''),
+        'stats': {},
+        'markdown': '',
+        'items': 0
+    }
+
+    if tweet.get('conversation_count') is not None:
+        result['stats']['reply'] = str(tweet['conversation_count'])
+    if tweet.get('favorite_count') is not None:
+        result['stats']['like'] = str(tweet['favorite_count'])
+
+    # Same block layout as the in-page renderer: one paragraph per line, then media
+    buf = io.StringIO()
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            buf.write(f"\n\n{line}\n")
+            result['items'] += 1
+
+    for media in tweet.get('mediaDetails') or []:
+        src = media.get('media_url_https', '')
+        large = (media.get('sizes') or {}).get('large') or {}
+        if src and large.get('w', 0) > 100 and large.get('h', 0) > 100:
+            alt = media.get('ext_alt_text') or 'Image'
+            buf.write(f"\n\n![{alt}]({src})\n")
+            result['items'] += 1
+
+    result['markdown'] = buf.getvalue()
+    return result
+
+
+# Installed before navigation: no animations/transitions, and thread cells are
+# never skipped by content-visibility, so fewer scrolls are needed to render them
+QUIET_PAGE_SCRIPT = '''(() => {
+    const install = () => {
+        const style = document.createElement('style');
+        style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }'
+            + ' [data-testid="cellInnerDiv"] { content-visibility: visible !important; }';
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) {
+        install();
+    } else {
+        document.addEventListener('readystatechange', install, { once: true });
+    }
+})();'''
+
+# Scrolls to the bottom and reports [scrollHeight, rendered cell count]
+SCROLL_STEP_SCRIPT = f'''() => {{
+    window.scrollTo(0, document.body.scrollHeight);
+    return [document.body.scrollHeight, document.querySelectorAll('{CELL_SELECTOR}').length];
+}}'''
+
+# Installed before navigation: clicks "show more" style controls as X renders them
+SHOW_MORE_OBSERVER_SCRIPT = '''(() => {
+    const SELECTOR = '[data-testid="tweet-text-show-more-link"], div[role="button"], span[role="button"], a[role="link"]';
+    const expand = (el) => {
+        const text = (el.textContent || '').trim().toLowerCase();
+        if (text === 'show more' || text === 'read more' || text === 'see more') {
+            el.click();
+        }
+    };
+    new MutationObserver(mutations => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                if (n.nodeType !== 1) continue;
+                if (n.matches(SELECTOR)) expand(n);
+                for (const el of n.querySelectorAll(SELECTOR)) expand(el);
+            }
+        }
+    }).observe(document, { childList: true, subtree: true });
+})();'''
+
+# Returns the href of the full article view, if the tweet links to one
+ARTICLE_LINK_SCRIPT = '''() => {
+    const link = document.querySelector('a[href*="/article/"], a[href*="/i/article/"]');
+    return link ? link.href : '';
+}'''
+
+# Walks the rendered page and returns title, author, stats and the markdown body
+EXTRACT_CONTENT_SCRIPT = '''() => {
+    const result = {
+        title: '',
+        author: '',
+        handle: '',
+        timestamp: '',
+        stats: {},
+        markdown: '',
+        items: 0
+    };
+    
+    // Extract author info
+    const authorElement = document.querySelector('[data-testid="User-Name"]');
+    if (authorElement) {
+        const nameEl = authorElement.querySelector('span');
+        const handleEl = authorElement.querySelector('a[href^="/"]');
+        if (nameEl) result.author = nameEl.innerText;
+        if (handleEl) result.handle = handleEl.innerText;
+    }
+    
+    // Extract timestamp
+    const timeElement = document.querySelector('time');
+    if (timeElement) {
+        result.timestamp = timeElement.getAttribute('datetime') || timeElement.innerText;
+    }
+    
+    // Extract stats (likes, retweets, etc)
+    const statsElements = document.querySelectorAll('[role="group"] [data-testid*="count"]');
+    statsElements.forEach(el => {
+        const text = el.innerText;
+        const testId = el.getAttribute('data-testid');
+        if (testId) {
+            result.stats[testId] = text;
+        }
+    });
+    
+    // Extract main content - prefer article containers.
+    // Score by textContent (no layout) and read innerText only once, on demand.
+    const innerTextCache = new WeakMap();
+    const innerTextOf = (el) => {
+        let text = innerTextCache.get(el);
+        if (text === undefined) {
+            text = el.innerText || '';
+            innerTextCache.set(el, text);
+        }
+        return text;
+    };
+    const articleBody = document.querySelector('[data-testid="article-body"]')
+        || document.querySelector('[data-testid="articleBody"]');
+    const candidates = [
+        articleBody,
+        document.querySelector('article'),
+        document.querySelector('[data-testid="tweetText"]')?.closest('article'),
+        document.querySelector('main')
+    ].filter(Boolean);
+    let container = candidates[0] || document.body;
+    let maxLen = 0;
+    for (const el of candidates) {
+        const len = (el.textContent || '').length;
+        if (len > maxLen) {
+            maxLen = len;
+            container = el;
+        }
+    }
+    
+    // Get text, images and title candidates in DOM order in a single pass.
+    // Dedup on 32-bit FNV-1a hashes so the sets hold numbers, not copies of every paragraph.
+    const fnv1a = (str) => {
+        let h = 2166136261 >>> 0;
+        for (let i = 0; i < str.length; i++) {
+            h ^= str.charCodeAt(i);
+            h = Math.imul(h, 16777619);
+        }
+        return h >>> 0;
+    };
+    const seenTexts = new Set();
+    const seenImages = new Set();
+    const MEDIA_SIZES = new Set(['small', 'medium', 'large', 'orig']);
+    // "large" renditions are bounded to 2048px on the longest edge
+    const LARGE_EDGE = 2048;
+    // Subtrees that never hold article content are not walked at all
+    const REJECTED_TAGS = new Set(['SCRIPT', 'STYLE', 'NAV', 'BUTTON', 'svg', 'SVG']);
+    const walker = document.createTreeWalker(container, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: (n) => REJECTED_TAGS.has(n.tagName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+    });
+    let totalTextLen = 0;
+    let firstHeading = null;
+    let firstTweetText = null;
+
+    // Reflected ARIA properties are plain reads, unlike getAttribute lookups
+    const isSkippable = (el) => el.ariaHidden === 'true' || el.role === 'button';
+
+    // Render markdown in the page so a single string crosses back to Python;
+    // block layout matches what content_to_markdown produced from content items
+    const HEADING_PREFIX = { h1: '\\n# ', h2: '\\n## ', h3: '\\n### ', h4: '\\n#### ' };
+    const md = [];
+    let inList = false;
+
+    const emitText = (tag, text) => {
+        result.items++;
+        if (tag === 'li') {
+            md.push('\\n- ', text);
+            inList = true;
+            return;
+        }
+        // End list if we're starting a new block
+        if (inList) {
+            md.push('\\n');
+            inList = false;
+        }
+        md.push('\\n', HEADING_PREFIX[tag] || '\\n', text, '\\n');
+    };
+
+    const emitImage = (src, alt) => {
+        result.items++;
+        md.push('\\n\\n![', alt, '](', src, ')\\n');
+    };
+
+    const pushText = (tag, text, key) => {
+        seenTexts.add(key);
+        totalTextLen += text.length;
+        emitText(tag, text);
+    };
+
+    while (walker.nextNode()) {
+        const el = walker.currentNode;
+        const tag = el.tagName ? el.tagName.toLowerCase() : '';
+        if (!firstHeading && (tag === 'h1' || tag === 'h2')) firstHeading = el;
+        if (!firstTweetText && el.dataset && el.dataset.testid === 'tweetText') firstTweetText = el;
+        if (isSkippable(el)) continue;
+
+        if (tag === 'img') {
+            const src = el.getAttribute('src') || '';
+            if (!src || !src.includes('pbs.twimg.com')) continue;
+            // Media URLs carry their rendition (&name=small|large|900x900|...), so size is
+            // known without touching layout; avatars and emoji have no such token
+            const sizeTag = (src.match(/[?&]name=([^&]+)/) || [])[1] || '';
+            const dims = sizeTag.match(/^(\\d+)x(\\d+)$/);
+            let keep = false;
+            let upgrade = false;
+            if (MEDIA_SIZES.has(sizeTag)) {
+                keep = true;
+                upgrade = sizeTag === 'small' || sizeTag === 'medium';
+            } else if (dims) {
+                const w = Number(dims[1]);
+                const h = Number(dims[2]);
+                // Thumbnail renditions (120x120, 240x240 on cards) are also rendered
+                // small, so the layout size filters them like it did before
+                keep = w > 100 && h > 100 && el.width > 100 && el.height > 100;
+                upgrade = Math.max(w, h) < LARGE_EDGE;
+            } else {
+                // e.g. legacy URLs without a query: fall back to the layout size, since
+                // naturalWidth is always 0 while image downloads are blocked
+                keep = el.width > 100 && el.height > 100;
+            }
+            if (!keep) continue;
+            // Point the markdown at the high-res asset, never at a smaller one
+            const fullSrc = upgrade ? src.replace(/([?&]name=)[^&]+/, '$1large') : src;
+            const srcKey = fnv1a(fullSrc);
+            if (!seenImages.has(srcKey)) {
+                seenImages.add(srcKey);
+                emitImage(fullSrc, el.getAttribute('alt') || 'Image');
+            }
+            continue;
+        }
+
+        if (['h1','h2','h3','h4','h5','h6','p','li','blockquote','pre'].includes(tag)) {
+            const text = innerTextOf(el).trim();
+            if (!text) continue;
+            const key = fnv1a(text);
+            if (!seenTexts.has(key)) {
+                pushText(tag, text, key);
+            }
+            continue;
+        }
+
+        if ((tag === 'div' || tag === 'span') && el.children.length === 0) {
+            const text = el.innerText?.trim();
+            if (!text) continue;
+            const key = fnv1a(text);
+            if (!seenTexts.has(key)) {
+                pushText('p', text, key);
+            }
+        }
+    }
+
+    // Fallback: if we only captured a short summary, use raw innerText lines
+    if (totalTextLen < 400) {
+        const raw = innerTextOf(articleBody || container);
+        const lines = raw.split('\\n').map(l => l.trim()).filter(Boolean);
+        lines.forEach(line => {
+            const key = fnv1a(line);
+            if (seenTexts.has(key)) return;
+            let tag = 'p';
+            let content = line;
+            if (/^[-•]\\s+/.test(line)) {
+                tag = 'li';
+                content = line.replace(/^[-•]\\s+/, '');
+            }
+            seenTexts.add(key);
+            emitText(tag, content);
+        });
+    }
+    
+    // Title from the first heading or tweet text seen during the walk
+    if (firstHeading) {
+        result.title = innerTextOf(firstHeading).trim();
+    } else if (firstTweetText) {
+        const text = innerTextOf(firstTweetText).trim();
+        result.title = text.split('\\n')[0].substring(0, 100);
+    }
+    
+    result.markdown = md.join('');
+    return result;
+}'''
+
+
+def _is_blocked(request) -> bool:
+    """Return True for requests that only cost load time (binaries, analytics)."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    return any(part in request.url for part in BLOCKED_URL_PARTS)
+
+
+def _route_request(route):
+    if _is_blocked(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _route_request_async(route):
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _prepare_page(page):
+    """Install init scripts, block unneeded requests and keep the HTTP cache on."""
+    page.add_init_script(QUIET_PAGE_SCRIPT)
+    page.add_init_script(SHOW_MORE_OBSERVER_SCRIPT)
+    page.route('**/*', _route_request)
+    # page.route() turns the HTTP cache off; switch it back on so JS bundles are reused
+    cdp = page.context.new_cdp_session(page)
+    cdp.send('Network.setCacheDisabled', {'cacheDisabled': False})
+
+
+async def _prepare_page_async(page):
+    await page.add_init_script(QUIET_PAGE_SCRIPT)
+    await page.add_init_script(SHOW_MORE_OBSERVER_SCRIPT)
+    await page.route('**/*', _route_request_async)
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send('Network.setCacheDisabled', {'cacheDisabled': False})
+
+
+def _wait_for_content(page):
+    """Wait until the tweet/article body is rendered instead of sleeping."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+    try:
+        page.wait_for_selector(CONTENT_SELECTOR, timeout=10000)
+    except PlaywrightTimeout:
+        print(f"Warning: Post content did not render on {page.url}; extraction may be empty")
+
+
+async def _wait_for_content_async(page):
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    try:
+        await page.wait_for_selector(CONTENT_SELECTOR, timeout=10000)
+    except PlaywrightTimeout:
+        print(f"Warning: Post content did not render on {page.url}; extraction may be empty")
+
+
+def _grown_condition(height: int, cells: int) -> str:
+    return (
+        f'document.body.scrollHeight > {height} || '
+        f'document.querySelectorAll(\'{CELL_SELECTOR}\').length > {cells}'
+    )
+
+
+def _scroll_to_end(page):
+    """Scroll to the bottom until neither the page height nor the rendered cell count grows."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+    prev = None
+    for _ in range(MAX_SCROLLS):
+        height, cells = page.evaluate(SCROLL_STEP_SCRIPT)
+        if (height, cells) == prev:
+            break
+        try:
+            page.wait_for_function(_grown_condition(height, cells), timeout=1500)
+        except PlaywrightTimeout:
+            pass
+        prev = (height, cells)
+
+
+async def _scroll_to_end_async(page):
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    prev = None
+    for _ in range(MAX_SCROLLS):
+        height, cells = await page.evaluate(SCROLL_STEP_SCRIPT)
+        if (height, cells) == prev:
+            break
+        try:
+            await page.wait_for_function(_grown_condition(height, cells), timeout=1500)
+        except PlaywrightTimeout:
+            pass
+        prev = (height, cells)
+
+
+def _launch_persistent_context(playwright, headless: bool):
+    """Launch Chromium on the cached profile (works with sync and async Playwright)."""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    return playwright.chromium.launch_persistent_context(
+        user_data_dir=str(PROFILE_DIR),
+        headless=headless,
+        args=BROWSER_ARGS,
+        **CONTEXT_OPTIONS
+    )
+
+
+class BrowserPool:
+    """
+    One shared Chromium instance that hands out a fresh page per URL.
+
+    Launching Chromium dominates latency when converting several URLs, so the
+    browser is started lazily on first use and kept until shutdown(). It runs
+    on a persistent profile so X's JS/CSS bundles stay in the disk cache
+    between runs; each page() call only pays for a new tab.
+
+    Sync Playwright objects are bound to the thread that started them, so a
+    pool must only be used from one thread. Concurrent batch runs go through
+    cli_batch instead.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._playwright = None
+        self._context = None
+
+    def _ensure_context(self):
+        from playwright.sync_api import sync_playwright
+
+        if self._context is None:
+            print("Launching browser...")
+            self._playwright = sync_playwright().start()
+            self._context = _launch_persistent_context(self._playwright, self.headless)
+            atexit.register(self.shutdown)
+        return self._context
+
+    @contextmanager
+    def page(self):
+        """Yield a new page in the shared context, closing it afterwards."""
+        page = self._ensure_context().new_page()
+        try:
+            yield page
+        finally:
+            page.close()
+
+    def shutdown(self):
+        """Close the browser and stop Playwright (safe to call more than once)."""
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass
+            self._context = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+_browser_pool = None
+
+
+def _get_browser_pool(headless: bool = True) -> BrowserPool:
+    """Return the module-level pool, creating it on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(headless=headless)
+    return _browser_pool
+
+
+def extract_x_content(url: str, headless: bool = True, pool: BrowserPool = None) -> dict:
     """
     Extract full content from X.com article using browser automation.
     
     Args:
         url: X.com article URL
-        headless: Run browser in headless mode
+        headless: Run browser in headless mode (used when creating the default pool)
+        pool: Browser pool to take a page from; defaults to the module-level pool
         
     Returns:
-        Dictionary containing title, author, content, and metadata
+        Dictionary containing title, author, stats, and the markdown body
     """
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context(
-            viewport={'width': 1280, 'height': 720},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        )
-        page = context.new_page()
-        
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+    if pool is None:
+        pool = _get_browser_pool(headless)
+
+    with pool.page() as page:
         try:
+            _prepare_page(page)
             print(f"Loading URL: {url}")
-            page.goto(url, wait_until='networkidle', timeout=30000)
+            page.goto(url, wait_until='domcontentloaded', timeout=30000)
             
             # Wait for content to load
-            page.wait_for_timeout(2000)
+            _wait_for_content(page)
 
-            # Expand any truncated text before attempting article navigation
-            try:
-                page.evaluate('''() => {
-                    const targets = Array.from(document.querySelectorAll(
-                        '[data-testid="tweet-text-show-more-link"], div[role="button"], span[role="button"], a[role="link"]'
-                    ));
-                    targets.forEach(el => {
-                        const text = (el.innerText || '').trim().toLowerCase();
-                        if (text === 'show more' || text === 'read more' || text === 'see more') {
-                            el.click();
-                        }
-                    });
-                }''')
-                page.wait_for_timeout(500)
-            except Exception:
-                pass
-            
             # Try to click "Article" or "Focus mode" link if available
             try:
-                article_href = page.evaluate('''() => {
-                    const link = document.querySelector('a[href*="/article/"], a[href*="/i/article/"]');
-                    return link ? link.href : '';
-                }''')
+                article_href = page.evaluate(ARTICLE_LINK_SCRIPT)
                 if article_href and article_href != page.url:
                     print("Opening article link for full view...")
-                    page.goto(article_href, wait_until='networkidle', timeout=30000)
-                    page.wait_for_timeout(2000)
+                    page.goto(article_href, wait_until='domcontentloaded', timeout=30000)
+                    _wait_for_content(page)
             except:
                 print("No article link found, continuing with current view...")
 
-            # Expand any truncated text after navigation
-            try:
-                page.evaluate('''() => {
-                    const targets = Array.from(document.querySelectorAll(
-                        '[data-testid="tweet-text-show-more-link"], div[role="button"], span[role="button"], a[role="link"]'
-                    ));
-                    targets.forEach(el => {
-                        const text = (el.innerText || '').trim().toLowerCase();
-                        if (text === 'show more' || text === 'read more' || text === 'see more') {
-                            el.click();
-                        }
-                    });
-                }''')
-                page.wait_for_timeout(500)
-            except Exception:
-                pass
-            
             # Scroll to load all content
             print("Scrolling to load all content...")
-            for _ in range(5):
-                page.evaluate('window.scrollBy(0, 800)')
-                page.wait_for_timeout(500)
-            
-            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            page.wait_for_timeout(1000)
-
-            # Expand one more time after scrolling (newly loaded content)
-            try:
-                page.evaluate('''() => {
-                    const targets = Array.from(document.querySelectorAll(
-                        '[data-testid="tweet-text-show-more-link"], div[role="button"], span[role="button"], a[role="link"]'
-                    ));
-                    targets.forEach(el => {
-                        const text = (el.innerText || '').trim().toLowerCase();
-                        if (text === 'show more' || text === 'read more' || text === 'see more') {
-                            el.click();
-                        }
-                    });
-                }''')
-                page.wait_for_timeout(500)
-            except Exception:
-                pass
+            _scroll_to_end(page)
             
             # Extract content using JavaScript
             print("Extracting content...")
-            content_data = page.evaluate('''() => {
-                const result = {
-                    title: '',
-                    author: '',
-                    handle: '',
-                    timestamp: '',
-                    stats: {},
-                    content: []
-                };
-                
-                // Extract author info
-                const authorElement = document.querySelector('[data-testid="User-Name"]');
-                if (authorElement) {
-                    const nameEl = authorElement.querySelector('span');
-                    const handleEl = authorElement.querySelector('a[href^="/"]');
-                    if (nameEl) result.author = nameEl.innerText;
-                    if (handleEl) result.handle = handleEl.innerText;
-                }
-                
-                // Extract timestamp
-                const timeElement = document.querySelector('time');
-                if (timeElement) {
-                    result.timestamp = timeElement.getAttribute('datetime') || timeElement.innerText;
-                }
-                
-                // Extract stats (likes, retweets, etc)
-                const statsElements = document.querySelectorAll('[role="group"] [data-testid*="count"]');
-                statsElements.forEach(el => {
-                    const text = el.innerText;
-                    const testId = el.getAttribute('data-testid');
-                    if (testId) {
-                        result.stats[testId] = text;
-                    }
-                });
-                
-                // Extract main content - prefer article containers
-                const candidates = [
-                    document.querySelector('[data-testid="article-body"]'),
-                    document.querySelector('[data-testid="articleBody"]'),
-                    document.querySelector('article'),
-                    document.querySelector('[data-testid="tweetText"]')?.closest('article'),
-                    document.querySelector('main')
-                ].filter(Boolean);
-                let container = candidates[0] || document.body;
-                let maxLen = 0;
-                for (const el of candidates) {
-                    const len = (el.innerText || '').length;
-                    if (len > maxLen) {
-                        maxLen = len;
-                        container = el;
-                    }
-                }
-                
-                // Get text and images in DOM order
-                const seenTexts = new Set();
-                const seenImages = new Set();
-                const walker = document.createTreeWalker(container, NodeFilter.SHOW_ELEMENT);
-
-                const isSkippable = (el) => {
-                    if (!el) return true;
-                    if (el.getAttribute && el.getAttribute('aria-hidden') === 'true') return true;
-                    const role = el.getAttribute && el.getAttribute('role');
-                    if (role === 'button') return true;
-                    return false;
-                };
-
-                while (walker.nextNode()) {
-                    const el = walker.currentNode;
-                    if (isSkippable(el)) continue;
-                    const tag = el.tagName ? el.tagName.toLowerCase() : '';
-
-                    if (tag === 'img') {
-                        const src = el.getAttribute('src') || '';
-                        if (src && src.includes('pbs.twimg.com') && !seenImages.has(src)) {
-                            const w = el.naturalWidth || el.width || 0;
-                            const h = el.naturalHeight || el.height || 0;
-                            if (w > 100 && h > 100) {
-                                seenImages.add(src);
-                                result.content.push({
-                                    type: 'image',
-                                    src,
-                                    alt: el.getAttribute('alt') || 'Image'
-                                });
-                            }
-                        }
-                        continue;
-                    }
-
-                    if (['h1','h2','h3','h4','h5','h6','p','li','blockquote','pre'].includes(tag)) {
-                        const text = el.innerText?.trim();
-                        if (text && !seenTexts.has(text)) {
-                            seenTexts.add(text);
-                            result.content.push({
-                                type: 'text',
-                                tag,
-                                content: text
-                            });
-                        }
-                        continue;
-                    }
-
-                    if ((tag === 'div' || tag === 'span') && el.children.length === 0) {
-                        const text = el.innerText?.trim();
-                        if (text && !seenTexts.has(text)) {
-                            seenTexts.add(text);
-                            result.content.push({
-                                type: 'text',
-                                tag: 'p',
-                                content: text
-                            });
-                        }
-                    }
-                }
-
-                // Fallback: if we only captured a short summary, use raw innerText lines
-                const totalTextLen = result.content
-                    .filter(item => item.type === 'text')
-                    .reduce((sum, item) => sum + (item.content?.length || 0), 0);
-                if (totalTextLen < 400) {
-                    const articleBody = document.querySelector('[data-testid="article-body"], [data-testid="articleBody"]') || container;
-                    const raw = (articleBody && articleBody.innerText) ? articleBody.innerText : '';
-                    const lines = raw.split('\\n').map(l => l.trim()).filter(Boolean);
-                    lines.forEach(line => {
-                        if (seenTexts.has(line)) return;
-                        let tag = 'p';
-                        let content = line;
-                        if (/^[-•]\\s+/.test(line)) {
-                            tag = 'li';
-                            content = line.replace(/^[-•]\\s+/, '');
-                        }
-                        seenTexts.add(line);
-                        result.content.push({
-                            type: 'text',
-                            tag,
-                            content
-                        });
-                    });
-                }
-                
-                // Images are extracted in DOM order above
-                
-                // Try to extract title from first heading or tweet text
-                const firstHeading = container.querySelector('h1, h2');
-                if (firstHeading) {
-                    result.title = firstHeading.innerText.trim();
-                } else {
-                    const tweetText = container.querySelector('[data-testid="tweetText"]');
-                    if (tweetText) {
-                        const text = tweetText.innerText.trim();
-                        result.title = text.split('\\n')[0].substring(0, 100);
-                    }
-                }
-                
-                return result;
-            }()''')
+            content_data = page.evaluate(EXTRACT_CONTENT_SCRIPT)
             
-            browser.close()
             return content_data
             
         except PlaywrightTimeout:
             print("Error: Timeout while loading page")
-            browser.close()
             return None
         except Exception as e:
             print(f"Error: {e}")
-            browser.close()
             return None
 
 
+async def extract_x_content_async(url: str, context, sem: asyncio.Semaphore) -> dict:
+    """
+    Async variant of extract_x_content for batch runs.
+
+    Args:
+        url: X.com article URL
+        context: Shared async Playwright browser context
+        sem: Semaphore bounding how many pages load at once
+
+    Returns:
+        Dictionary containing title, author, stats, and the markdown body
+    """
+    async with sem:
+        page = await context.new_page()
+        try:
+            await _prepare_page_async(page)
+            print(f"Loading URL: {url}")
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await _wait_for_content_async(page)
+
+            try:
+                article_href = await page.evaluate(ARTICLE_LINK_SCRIPT)
+                if article_href and article_href != page.url:
+                    print(f"Opening article link for full view: {article_href}")
+                    await page.goto(article_href, wait_until='domcontentloaded', timeout=30000)
+                    await _wait_for_content_async(page)
+            except Exception:
+                pass
+
+            await _scroll_to_end_async(page)
+
+            return await page.evaluate(EXTRACT_CONTENT_SCRIPT)
+
+        except Exception as e:
+            print(f"Error ({url}): {e}")
+            return None
+        finally:
+            await page.close()
+
+
 def content_to_markdown(data: dict, url: str) -> str:
     """
-    Convert extracted content to markdown format.
+    Prepend the title, metadata and stats header to the extracted markdown body.
     
     Args:
         data: Extracted content dictionary
@@ -347,17 +810,19 @@ def content_to_markdown(data: dict, url: str) -> str:
     Returns:
         Formatted markdown string
     """
-    md_lines = []
+    buf = io.StringIO()
+    w = buf.write
     
     # Title
     title = data.get('title', 'X Article').strip()
     if not title or title == 'X Article':
         # Extract from URL as fallback
-        match = re.search(r'/status/(\d+)', url)
+        match = _RE_STATUS.search(url)
         if match:
             title = f"X Article {match.group(1)}"
     
-    md_lines.append(f"# {title}\n")
+    # Every block after the title is written with its leading line break
+    w(f"# {title}\n")
     
     # Metadata
     author = data.get('author', '')
@@ -365,139 +830,270 @@ def content_to_markdown(data: dict, url: str) -> str:
     timestamp = data.get('timestamp', '')
     
     if author or handle:
-        author_line = f"**Author:** {author}"
+        w(f"\n**Author:** {author}")
         if handle:
-            author_line += f" ({handle})"
-        md_lines.append(author_line)
+            w(f" ({handle})")
     
     if timestamp:
-        md_lines.append(f"**Date:** {timestamp}")
+        w(f"\n**Date:** {timestamp}")
     
-    md_lines.append(f"**Source:** [{url}]({url})")
+    w(f"\n**Source:** [{url}]({url})")
     
     # Stats
     stats = data.get('stats', {})
     if stats:
         stats_parts = []
         for key, value in stats.items():
-            label = key.replace('data-testid="', '').replace('"', '').replace('-', ' ').title()
+            # Test IDs look like "like-count"; labels for the known ones are fixed
+            bare = key.split('-')[0]
+            label = _STAT_LABELS.get(bare) or bare.title()
             stats_parts.append(f"{value} {label}")
         if stats_parts:
-            md_lines.append(f"**Stats:** {' | '.join(stats_parts)}")
+            w(f"\n**Stats:** {' | '.join(stats_parts)}")
     
-    md_lines.append("\n---\n")
+    w("\n\n---\n")
     
-    # Content
-    content_items = data.get('content', [])
-    current_list_type = None
+    # Content (rendered by the extractor)
+    w(data.get('markdown', ''))
     
-    for item in content_items:
-        item_type = item.get('type')
-        
-        if item_type == 'text':
-            tag = item.get('tag', 'p')
-            text = item.get('content', '').strip()
-            
-            if not text:
-                continue
-            
-            # End list if we're starting a new block
-            if current_list_type and tag not in ['li']:
-                current_list_type = None
-                md_lines.append('')
-            
-            if tag == 'h1':
-                md_lines.append(f"\n# {text}\n")
-            elif tag == 'h2':
-                md_lines.append(f"\n## {text}\n")
-            elif tag == 'h3':
-                md_lines.append(f"\n### {text}\n")
-            elif tag == 'h4':
-                md_lines.append(f"\n#### {text}\n")
-            elif tag == 'li':
-                md_lines.append(f"- {text}")
-                current_list_type = 'ul'
-            else:
-                md_lines.append(f"\n{text}\n")
-        
-        elif item_type == 'image':
-            src = item.get('src', '')
-            alt = item.get('alt', 'Image')
-            if src:
-                md_lines.append(f"\n![{alt}]({src})\n")
-    
-    return '\n'.join(md_lines)
+    return buf.getvalue()
 
 
-def main():
-    """Main function to process X.com URL and create markdown file."""
-    if len(sys.argv) < 2:
-        print("Usage: python x_to_markdown.py [-o output_dir] <x.com_url>")
-        print("\nExample:")
-        print("  python x_to_markdown.py -o ./out_put https://x.com/bozhou_ai/status/2011738838767423983")
-        sys.exit(1)
-    
-    args = sys.argv[1:]
-    output_dir_arg = ""
-    url = ""
-
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg in ("-o", "--output") and i + 1 < len(args):
-            output_dir_arg = args[i + 1]
-            i += 2
-            continue
-        if not arg.startswith("-") and not url:
-            url = arg
-        i += 1
-
-    if not url:
-        print("Usage: python x_to_markdown.py [-o output_dir] <x.com_url>")
-        print("\nExample:")
-        print("  python x_to_markdown.py -o ./out_put https://x.com/bozhou_ai/status/2011738838767423983")
-        sys.exit(1)
-    
-    # Validate URL
-    if 'x.com' not in url and 'twitter.com' not in url:
-        print("Error: URL must be from x.com or twitter.com")
-        sys.exit(1)
-    
-    print(f"\n{'='*60}")
-    print("X.com to Markdown Converter")
-    print(f"{'='*60}\n")
-    
-    # Extract content
-    data = extract_x_content(url)
-    
+def _has_content(data: dict) -> bool:
+    """True if the extraction produced a body (login walls and error pages do not)."""
+    return bool(data.get('items')) or bool(data.get('markdown', '').strip())
+
+
+def _cache_path(status_id: str) -> Path:
+    return CACHE_DIR / f'{status_id}.json'
+
+
+def _read_cache(url: str) -> dict:
+    """Return the cached extraction for the URL's status ID, or None if missing or stale."""
+    match = _RE_STATUS.search(url)
+    if not match:
+        return None
+    cache_path = _cache_path(match.group(1))
+    try:
+        if time.time() - cache_path.stat().st_mtime >= CACHE_TTL:
+            return None
+        data = _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if 'markdown' not in data or not _has_content(data):
+        # Written before the body was rendered in the page, or an empty extraction
+        return None
+    print(f"Using cached content: {cache_path}")
+    return data
+
+
+def _write_cache(url: str, data: dict):
+    match = _RE_STATUS.search(url)
+    if not match:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(match.group(1)).write_bytes(_dumps(data))
+    except OSError as e:
+        print(f"Warning: Could not write cache: {e}")
+
+
+def _try_syndication(url: str) -> dict:
+    """Fetch the tweet via the syndication API, returning None if the browser is needed."""
+    match = _RE_STATUS.search(url)
+    if not match:
+        return None
+    try:
+        print(f"Fetching tweet via syndication API: {url}")
+        data = _fetch_syndication(match.group(1))
+    except Exception as e:
+        print(f"Syndication fetch failed: {e}")
+        data = None
     if not data:
-        print("\nError: Failed to extract content from URL")
-        sys.exit(1)
-    
-    # Convert to markdown
+        print("Falling back to browser rendering...")
+    return data
+
+
+async def _try_syndication_async(url: str, client, sem: asyncio.Semaphore) -> dict:
+    match = _RE_STATUS.search(url)
+    if not match:
+        return None
+    async with sem:
+        try:
+            print(f"Fetching tweet via syndication API: {url}")
+            data = await _fetch_syndication_async(match.group(1), client)
+        except Exception as e:
+            print(f"Syndication fetch failed ({url}): {e}")
+            data = None
+    if not data:
+        print(f"Falling back to browser rendering: {url}")
+    return data
+
+
+def save_markdown(data: dict, url: str, output_dir: Path) -> Path:
+    """Convert extracted content to markdown and write it into output_dir."""
     markdown_content = content_to_markdown(data, url)
-    
-    # Generate filename
     filename = build_filename(data, url) + '.md'
-    
-    # Determine output directory
-    output_dir = Path(output_dir_arg).expanduser().resolve() if output_dir_arg else (Path.home() / 'tmp')
-    if ((not Path.home()) and not output_dir_arg) or not output_dir.exists() or not output_dir.is_dir():
-        print(f"\nError: Output directory not found: {output_dir}")
-        if not output_dir_arg:
-            print("Please create $HOME/tmp and try again.")
-        sys.exit(1)
-
-    # Save to file
     output_path = output_dir / filename
-    output_path.write_text(markdown_content, encoding='utf-8')
-    
+    with output_path.open('wb') as f:
+        f.write(markdown_content.encode('utf-8'))
+
     print(f"\n{'='*60}")
     print(f"✓ Successfully created: {output_path}")
     print(f"  File size: {output_path.stat().st_size} bytes")
-    print(f"  Content items: {len(data.get('content', []))}")
+    print(f"  Content items: {data.get('items', 0)}")
+    print(f"{'='*60}\n")
+    return output_path
+
+
+async def cli_batch(urls: list, output_dir: Path, jobs: int = BATCH_JOBS, headless: bool = True,
+                    use_cache: bool = True, refresh: bool = False) -> int:
+    """
+    Convert several URLs concurrently, sharing one browser between them.
+
+    Args:
+        urls: X.com URLs to convert
+        output_dir: Directory the markdown files are written to
+        jobs: Maximum number of syndication requests / pages in flight at once
+        headless: Run browser in headless mode
+        use_cache: Read and write the on-disk content cache
+        refresh: Ignore cached entries but still update the cache
+
+    Returns:
+        Number of URLs that could not be converted
+    """
+    if use_cache and not refresh:
+        results = [_read_cache(url) for url in urls]
+    else:
+        results = [None] * len(urls)
+    cached = [bool(data) for data in results]
+
+    # One semaphore bounds both the syndication requests and the browser pages
+    sem = asyncio.Semaphore(jobs)
+
+    pending = [url for url, data in zip(urls, results) if not data]
+    if pending:
+        import httpx
+
+        async with httpx.AsyncClient(**SYNDICATION_CLIENT_OPTIONS) as client:
+            fetched = await asyncio.gather(
+                *(_try_syndication_async(url, client, sem) for url in pending)
+            )
+        fetched_by_url = dict(zip(pending, fetched))
+        results = [data or fetched_by_url.get(url) for url, data in zip(urls, results)]
+
+    pending = [url for url, data in zip(urls, results) if not data]
+    if pending:
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            print("Launching browser...")
+            context = await _launch_persistent_context(p, headless)
+            try:
+                rendered = await asyncio.gather(
+                    *(extract_x_content_async(url, context, sem) for url in pending)
+                )
+            finally:
+                await context.close()
+        rendered_by_url = dict(zip(pending, rendered))
+        results = [data or rendered_by_url.get(url) for url, data in zip(urls, results)]
+
+    failures = 0
+    for url, data, from_cache in zip(urls, results, cached):
+        if not data:
+            print(f"\nError: Failed to extract content from URL: {url}")
+            failures += 1
+            continue
+        if use_cache and not from_cache and _has_content(data):
+            _write_cache(url, data)
+        save_markdown(data, url, output_dir)
+    return failures
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="Convert X.com posts and articles to markdown files.",
+        epilog="Example: python x_to_markdown.py -o ./out_put https://x.com/bozhou_ai/status/2011738838767423983"
+    )
+    ap.add_argument('urls', nargs='*', metavar='url', help="x.com / twitter.com post URL(s)")
+    ap.add_argument('--batch', type=Path, metavar='FILE',
+                    help="read additional URLs from FILE, one per line (# starts a comment)")
+    ap.add_argument('-o', '--output-dir', '--output', dest='output_dir', type=Path,
+                    default=Path.home() / 'tmp', help="output directory (default: $HOME/tmp)")
+    ap.add_argument('--jobs', type=int, default=None,
+                    help=f"pages loaded concurrently in batch mode (default: {BATCH_JOBS})")
+    ap.add_argument('--headless', action=argparse.BooleanOptionalAction, default=True,
+                    help="run the browser headless (default: yes)")
+    ap.add_argument('--refresh', action='store_true', help="ignore cached content and re-fetch")
+    ap.add_argument('--no-cache', dest='use_cache', action='store_false',
+                    help="neither read nor write the content cache")
+    args = ap.parse_args(argv)
+
+    if args.batch:
+        try:
+            lines = args.batch.read_text(encoding='utf-8').splitlines()
+        except OSError as e:
+            ap.error(f"cannot read batch file: {e}")
+        for line in lines:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                args.urls.append(line)
+
+    if not args.urls:
+        ap.error("at least one URL is required")
+    if args.jobs is not None and args.jobs < 1:
+        ap.error("--jobs must be at least 1")
+    for url in args.urls:
+        if urlparse(url).hostname not in ALLOWED_HOSTS:
+            ap.error(f"URL must be from x.com or twitter.com: {url}")
+    return args
+
+
+def main():
+    """Main function to process X.com URLs and create markdown files."""
+    args = _parse_args()
+    urls = args.urls
+
+    # Determine output directory
+    output_dir = args.output_dir.expanduser().resolve()
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"\nError: Cannot create output directory {output_dir}: {e}")
+        sys.exit(1)
+
+    print(f"\n{'='*60}")
+    print("X.com to Markdown Converter")
     print(f"{'='*60}\n")
 
+    if len(urls) > 1 or (args.jobs or 1) > 1:
+        failures = asyncio.run(cli_batch(
+            urls, output_dir,
+            jobs=args.jobs or BATCH_JOBS,
+            headless=args.headless,
+            use_cache=args.use_cache,
+            refresh=args.refresh
+        ))
+        if failures:
+            sys.exit(1)
+        return
+
+    url = urls[0]
+
+    data = _read_cache(url) if args.use_cache and not args.refresh else None
+    if not data:
+        # Extract content: try the syndication API first, fall back to the browser
+        data = _try_syndication(url) or extract_x_content(url, headless=args.headless)
+
+        if not data:
+            print("\nError: Failed to extract content from URL")
+            sys.exit(1)
+
+        if args.use_cache and _has_content(data):
+            _write_cache(url, data)
+    
+    save_markdown(data, url, output_dir)
+
 
 if __name__ == '__main__':
     main()